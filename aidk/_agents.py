@@ -3,11 +3,71 @@
 This module exposes Agent (alias), MultiAgent and CollaborativeAgent convenience
 wrappers to keep older tests/imports working.
 """
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+
 from .agents.agent import Agent as _AgentClass
-from .models import Model
+from .models import Model, aggregate_usage
 from typing import List, Dict, Any
 
 
+class RateLimiter:
+    """
+    Async rate limiter combining a concurrency cap with sliding-window
+    requests-per-minute and tokens-per-minute budgets.
+
+    Throttling requests preemptively keeps concurrent fan-outs under the
+    provider's account limits instead of triggering 429s and reactive
+    backoff, which is slower overall.
+    """
+
+    def __init__(self, max_concurrent: int = 8, rpm: int = None, tpm: int = None):
+        """
+        Initialize the rate limiter.
+
+        Parameters
+        ----------
+        max_concurrent : int, optional
+            Maximum number of in-flight requests. Defaults to 8.
+        rpm : int, optional
+            Maximum requests per minute, unlimited if None
+        tpm : int, optional
+            Maximum estimated tokens per minute, unlimited if None
+        """
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._rpm = rpm
+        self._tpm = tpm
+        self._window = deque()  # (timestamp, estimated_tokens)
+
+    @asynccontextmanager
+    async def acquire(self, estimated_tokens: int = 0):
+        """Hold a slot for one request, waiting for budget if needed."""
+        async with self._semaphore:
+            await self._wait_for_budget(estimated_tokens)
+            yield
+
+    async def _wait_for_budget(self, estimated_tokens: int) -> None:
+        if self._rpm is None and self._tpm is None:
+            return
+        if self._tpm is not None and estimated_tokens > self._tpm:
+            # A single request larger than the whole budget could never
+            # fit; clamp its charge so it is admitted once the window is
+            # empty instead of sleeping forever with a semaphore slot held.
+            estimated_tokens = self._tpm
+        while True:
+            now = time.monotonic()
+            while self._window and now - self._window[0][0] > 60:
+                self._window.popleft()
+            requests_ok = self._rpm is None or len(self._window) < self._rpm
+            tokens_ok = self._tpm is None or sum(t for _, t in self._window) + estimated_tokens <= self._tpm
+            if requests_ok and tokens_ok:
+                self._window.append((now, estimated_tokens))
+                return
+            await asyncio.sleep(1)
+
+
 class Agent(_AgentClass):
     """Compatibility wrapper: allow provider/model kwargs like older API."""
     def __init__(self, provider: str | None = None, model: str | None = None, *args, **kwargs):
@@ -22,14 +82,88 @@ class Agent(_AgentClass):
 
 
 class MultiAgent:
-    """Simple multi-model wrapper: uses the first model for execution."""
-    def __init__(self, models: List[Dict[str, str]], tools: List[Any] = None):
+    """Simple multi-model wrapper: runs the prompt on every model in parallel.
+
+    With mode="speculative" and a small draft model paired with a large
+    target model, the draft answers first and the target only verifies;
+    the target generates a full answer just when it rejects the draft.
+
+    After each run(), last_usage holds the total tokens and cost across
+    all calls made by that run, aggregated in one pass at the end.
+    """
+    def __init__(self, models: List[Dict[str, str]], tools: List[Any] = None,
+                 max_concurrent: int = 8, rpm: int = None, tpm: int = None,
+                 mode: str = "parallel", draft_idx: int = 0, target_idx: int = 1):
+        if mode not in ("parallel", "speculative"):
+            raise ValueError(f"Unknown mode: {mode}")
+        if mode == "speculative" and len(models) < 2:
+            raise ValueError("Speculative mode needs a draft and a target model")
         self._models = [Model(provider=m["provider"], model=m["model"]) for m in models]
         self._tools = tools
+        self._limiter = RateLimiter(max_concurrent=max_concurrent, rpm=rpm, tpm=tpm)
+        self._mode = mode
+        self._draft_idx = draft_idx
+        self._target_idx = target_idx
+        self.last_usage = None
+
+    def _estimate_tokens(self, model: Model, prompt) -> int:
+        try:
+            from .prompts.prompt_chain import PromptChain
+            if isinstance(prompt, PromptChain):
+                # One pass builds the joined string, digest and counts the
+                # request and cache paths will need anyway
+                prompt.precompute(model.model)
+                return sum(prompt.token_counts(model.model))
+            from .tokens import TokenCounter
+            return TokenCounter().count(model.model, str(prompt), "")["input_tokens"]
+        except Exception:
+            # Rough fallback when no encoder is available
+            return len(str(prompt)) // 4
+
+    async def _limited_ask(self, model: Model, prompt) -> Any:
+        estimated_tokens = self._estimate_tokens(model, prompt) if self._limiter._tpm is not None else 0
+        async with self._limiter.acquire(estimated_tokens):
+            return await model._ask_async(prompt)
+
+    async def _run_async(self, prompt) -> List[Any]:
+        tasks = [self._limited_ask(model, prompt) for model in self._models]
+        responses = await asyncio.gather(*tasks)
+        # One deferred pass instead of per-call running totals
+        self.last_usage = aggregate_usage(responses)
+        return responses
+
+    async def _run_speculative_async(self, prompt) -> Any:
+        # The cheap draft model answers; the expensive target only emits a
+        # one-word verdict unless it has to redo the answer itself.
+        draft_model = self._models[self._draft_idx]
+        target_model = self._models[self._target_idx]
+        draft = await self._limited_ask(draft_model, prompt)
+        verdict = await self._limited_ask(target_model, (
+            f"Question:\n{prompt}\n\n"
+            f"Proposed answer:\n{draft.response}\n\n"
+            "Reply with exactly ACCEPT if the proposed answer is correct and "
+            "complete, otherwise reply with exactly REJECT."
+        ))
+        calls = [draft, verdict]
+        if "ACCEPT" in str(verdict.response).upper():
+            result = draft
+        else:
+            result = await self._limited_ask(target_model, prompt)
+            calls.append(result)
+        self.last_usage = aggregate_usage(calls)
+        return result
 
-    def run(self, prompt):
-        # use first model to run
-        return self._models[0].ask(prompt)
+    def run(self, prompt) -> Any:
+        # Run on the shared background loop: the limiter's semaphore binds
+        # to the loop that first awaits it, and per-call asyncio.run loops
+        # would both break it on the second call and strand the pooled
+        # litellm HTTP client's connections.
+        from ._loop import run_sync
+        if self._mode == "speculative":
+            # single accepted answer instead of one response per model
+            return run_sync(self._run_speculative_async(prompt))
+        # fan the prompt out to all models concurrently
+        return run_sync(self._run_async(prompt))
 
 
 class CollaborativeAgent(MultiAgent):
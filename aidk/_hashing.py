@@ -0,0 +1,36 @@
+"""Content hashing for cache keys."""
+
+import hashlib
+
+try:
+    # blake3 dispatches to AVX-512/AVX2/NEON at runtime and is several
+    # times faster than the stdlib hashes on large inputs
+    from blake3 import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
+
+def content_hexdigest(data: bytes, digest_size: int = 16) -> str:
+    """
+    Hash data for use as a cache key.
+
+    Uses the optional blake3 package when installed and falls back to the
+    stdlib blake2b otherwise; both truncate to digest_size bytes so keys
+    stay compact. The two produce different digests, so installed caches
+    don't carry over between the two backends.
+
+    Parameters
+    ----------
+    data : bytes
+        The content to hash
+    digest_size : int, optional
+        Digest length in bytes. Defaults to 16, plenty for cache keys.
+
+    Returns
+    -------
+    str
+        Hex digest of the content
+    """
+    if _blake3 is not None:
+        return _blake3(data).hexdigest(length=digest_size)
+    return hashlib.blake2b(data, digest_size=digest_size).hexdigest()
@@ -0,0 +1,30 @@
+"""JSON helpers that use orjson when available, stdlib json otherwise."""
+
+import json as _stdlib_json
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+if _orjson is not None:
+
+    def loads(data):
+        """Parse a JSON string or bytes."""
+        return _orjson.loads(data)
+
+    def dumps(obj, sort_keys: bool = False, default=None) -> bytes:
+        """Serialize an object to JSON bytes."""
+        option = _orjson.OPT_SORT_KEYS if sort_keys else 0
+        return _orjson.dumps(obj, option=option, default=default)
+
+else:
+
+    def loads(data):
+        """Parse a JSON string or bytes."""
+        return _stdlib_json.loads(data)
+
+    def dumps(obj, sort_keys: bool = False, default=None) -> bytes:
+        """Serialize an object to JSON bytes."""
+        return _stdlib_json.dumps(obj, sort_keys=sort_keys, default=default).encode()
@@ -0,0 +1,60 @@
+"""Shared background event loop for synchronous entry points."""
+
+import asyncio
+import threading
+
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def get_shared_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the process-wide background event loop, starting it on first use.
+
+    Spinning up a fresh loop per synchronous call (asyncio.run) pays
+    selector and thread-local setup every time; the shared loop runs
+    forever on a daemon thread and lets all sync callers reuse one loop
+    and its connection pools. Uses uvloop when installed.
+
+    Returns
+    -------
+    asyncio.AbstractEventLoop
+        The running shared loop
+    """
+    global _loop
+    if _loop is not None:
+        return _loop
+    with _loop_lock:
+        if _loop is not None:
+            return _loop
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True, name="aidk-loop")
+        thread.start()
+        _loop = loop
+        return _loop
+
+
+def run_sync(coro):
+    """
+    Run a coroutine on the shared loop and block until it completes.
+
+    Safe to call both from plain synchronous code and from code that is
+    itself running inside another event loop, since the shared loop lives
+    on its own thread.
+
+    Parameters
+    ----------
+    coro : Coroutine
+        The coroutine to execute
+
+    Returns
+    -------
+    Any
+        The coroutine's result
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_shared_loop()).result()
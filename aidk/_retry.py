@@ -0,0 +1,70 @@
+"""Retry helper for transient provider errors."""
+
+import asyncio
+import functools
+import random
+import time
+
+_MAX_ATTEMPTS = 6
+_MAX_WAIT = 60.0
+
+
+def _retryable_exceptions() -> tuple:
+    """Exception types worth retrying: rate limits and transient faults."""
+    import litellm
+    return (
+        litellm.RateLimitError,
+        litellm.APIConnectionError,
+        litellm.InternalServerError
+    )
+
+
+def _wait_seconds(attempt: int, exc: Exception) -> float:
+    """
+    Seconds to sleep before the next attempt.
+
+    Honors the provider's Retry-After header when present, otherwise uses
+    exponential backoff with full jitter so concurrent callers hitting the
+    same rate limit don't retry in lockstep.
+    """
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if headers is not None:
+        retry_after = headers.get("retry-after")
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), _MAX_WAIT)
+            except ValueError:
+                pass
+    return random.uniform(0, min(2 ** attempt, _MAX_WAIT))
+
+
+def with_backoff(func):
+    """
+    Retry a completion call on transient provider errors.
+
+    Wraps both sync and async callables; up to 6 attempts with jittered
+    exponential backoff capped at 60 seconds. Non-transient errors and the
+    final failed attempt propagate unchanged.
+    """
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            for attempt in range(_MAX_ATTEMPTS):
+                try:
+                    return await func(*args, **kwargs)
+                except _retryable_exceptions() as exc:
+                    if attempt == _MAX_ATTEMPTS - 1:
+                        raise
+                    await asyncio.sleep(_wait_seconds(attempt, exc))
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                return func(*args, **kwargs)
+            except _retryable_exceptions() as exc:
+                if attempt == _MAX_ATTEMPTS - 1:
+                    raise
+                time.sleep(_wait_seconds(attempt, exc))
+    return wrapper
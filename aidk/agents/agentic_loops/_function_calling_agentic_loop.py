@@ -6,10 +6,16 @@ OpenAI's native function calling system for AI agents.
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List
 from ...prompts import Prompt
 from ._agentic_loop import _AgenticLoop
 
+# Shared pool for running the tool calls of a single model step in
+# parallel; tools are I/O-bound (web search, MCP servers) so threads
+# overlap their network waits.
+_tool_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="aidk-tool")
+
 
 class _FunctionCallingMixin:
     """Mixin for handling OpenAI function calling tool execution.
@@ -86,6 +92,12 @@ class _FunctionCallingMixin:
             "content": str(self._mcp_servers[server_name].call_tool(tool_name, tool_arguments))
         }
 
+    def _dispatch_tool_call(self, tool_call: Any) -> Dict[str, str]:
+        """Route a tool call to the MCP or plain tool handler."""
+        if tool_call.function.name.startswith("mcp_"):
+            return self._call_mcp_tool(tool_call)
+        return self._call_tool(tool_call)
+
 
 class FunctionCallingAgenticLoop(_AgenticLoop, _FunctionCallingMixin):
     """Agent that uses OpenAI's native function calling.
@@ -186,7 +198,8 @@ class FunctionCallingAgenticLoop(_AgenticLoop, _FunctionCallingMixin):
             self._update_usage(response, resp)
             
             if resp.get("tool_calls"):
-                for tool_call in resp["tool_calls"]:
+                tool_calls = resp["tool_calls"]
+                for tool_call in tool_calls:
                     # Check if human feedback is required for actions
                     if self._human_feedback == "actions" or self._human_feedback == "all":
                         action_data = {
@@ -196,21 +209,25 @@ class FunctionCallingAgenticLoop(_AgenticLoop, _FunctionCallingMixin):
                         if not self._request_human_feedback("action", f"Function call: {tool_call.function.name}", action_data):
                             print("Execution stopped by user.")
                             return response
-                    
-                    if tool_call.function.name.startswith("mcp_"):
-                        tool_result = self._call_mcp_tool(tool_call)
-                    else:
-                        tool_result = self._call_tool(tool_call)
+
+                # All calls of this step are independent, so run them in
+                # parallel; map preserves the original order for messages
+                if len(tool_calls) > 1:
+                    tool_results = list(_tool_executor.map(self._dispatch_tool_call, tool_calls))
+                else:
+                    tool_results = [self._dispatch_tool_call(tool_calls[0])]
+
+                for tool_call, tool_result in zip(tool_calls, tool_results):
                     iteration_data = {
                         "name": tool_call.function.name,
                         "arguments": tool_call.function.arguments,
                         "result": tool_result["content"]
                     }
-                    
+
                     # Add usage information to the iteration
                     if "usage" in resp:
                         iteration_data["usage"] = resp["usage"]
-                    
+
                     response["iterations"].append(iteration_data)
                     messages.append(tool_result)
             else:
@@ -38,7 +38,19 @@ class Conf:
             "summary":"Here is the summary of the conversation so far:\n\n",
             "file":"Here is the content of the file:\n\n"
         },
-        'observability': []
+        'observability': [],
+        'cache': {
+            "exact": False,
+            "exact_maxsize": 1024,
+            "exact_ttl": 3600,
+            "disk": False,
+            "disk_path": "~/.aidk/cache",
+            "disk_size_limit": 2 ** 31,
+            "semantic": False,
+            "semantic_maxsize": 1024,
+            "semantic_threshold": 0.95,
+            "rag_ttl": 3600
+        }
     }
     
     def __new__(cls):
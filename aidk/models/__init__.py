@@ -6,13 +6,14 @@ at module import time. Classes are imported only when accessed.
 """
 
 from .model import Model
+from ._response_processor import aggregate_usage
 from .hosted_model import HostedModel
 from .multi_model import MultiModel
 from .collaborative_model import CollaborativeModel
 from .image_model import ImageModel
 from .voice_model import VoiceModel
 
-__all__ = ['Model', "HostedModel", 'MultiModel', 'CollaborativeModel', 'ImageModel', 'VoiceModel']
+__all__ = ['Model', "HostedModel", 'MultiModel', 'CollaborativeModel', 'ImageModel', 'VoiceModel', 'aggregate_usage']
 
 # Backwards compatibility: old name 'CollectiveModel' -> 'CollaborativeModel'
 CollectiveModel = CollaborativeModel
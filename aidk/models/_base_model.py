@@ -40,5 +40,7 @@ class BaseModel(ABC):
         self._rag = rag
 
     def _add_tools(self, tools):
-        """Add tools to the model."""
+        """Add tools to the model, precomputing their litellm schemas."""
+        from ._prompt_executor import _parse_tools
         self._tools = tools
+        self._tools_spec = _parse_tools(tools) or None
@@ -0,0 +1,105 @@
+"""Client-side prefix index for provider prompt-cache routing."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+
+class _PrefixNode:
+    """One message position in the prefix tree."""
+
+    __slots__ = ("children", "key")
+
+    def __init__(self):
+        self.children: "OrderedDict[str, _PrefixNode]" = OrderedDict()
+        self.key: Optional[str] = None
+
+
+class _PrefixStore:
+    """
+    Radix-style index of the message prefixes sent by this process.
+
+    Conversations extending a previously seen prefix resolve to the same
+    key, which is forwarded to the provider as prompt_cache_key so its
+    router pins the request to the node already holding that KV prefix
+    instead of recomputing it on a cold one.
+
+    The tree is bounded: only the first max_depth messages of a
+    conversation are indexed, and the total node count is capped at
+    max_nodes by evicting the least-recently-touched conversation root
+    and its subtree, so long-running services don't grow it without
+    bound.
+    """
+
+    def __init__(self, max_nodes: int = 4096, max_depth: int = 32):
+        self._root = _PrefixNode()
+        self._lock = threading.Lock()
+        self._max_nodes = max_nodes
+        self._max_depth = max_depth
+        self._nodes = 0
+
+    def key_for(self, messages: List[Dict]) -> str:
+        """
+        Get the cache key of the longest known prefix of messages.
+
+        Unseen suffixes are inserted on the way down, so every later
+        conversation growing from the same opening messages inherits the
+        key minted on first sight. When the tree is full the oldest
+        conversation is evicted first; the returned key is derived from
+        the opening message either way, so it stays stable.
+
+        Parameters
+        ----------
+        messages : List[Dict]
+            The message list about to be sent
+
+        Returns
+        -------
+        str
+            Stable key identifying the shared prefix
+        """
+        hashes = [
+            hashlib.blake2b(
+                str(message.get("content", "")).encode(), digest_size=8
+            ).hexdigest()
+            for message in messages[: self._max_depth]
+        ]
+        with self._lock:
+            node = self._root
+            key = None
+            for depth, h in enumerate(hashes):
+                child = node.children.get(h)
+                if child is None:
+                    if self._nodes >= self._max_nodes:
+                        self._evict(keep=hashes[0])
+                    if self._nodes >= self._max_nodes:
+                        break  # still full: serve the key without indexing
+                    child = _PrefixNode()
+                    node.children[h] = child
+                    self._nodes += 1
+                elif depth == 0:
+                    # Mark this conversation root as recently touched
+                    self._root.children.move_to_end(h)
+                node = child
+                if node.key is not None:
+                    key = node.key
+            if key is None:
+                # First sighting: the opening message anchors the prefix
+                key = hashes[0]
+                root_child = self._root.children.get(hashes[0])
+                if root_child is not None:
+                    root_child.key = key
+            return key
+
+    def _evict(self, keep: str) -> None:
+        # Drop the least-recently-touched conversation root and its
+        # subtree, sparing the root the current request hangs off.
+        for h in self._root.children:
+            if h != keep:
+                subtree = self._root.children.pop(h)
+                self._nodes -= self._count(subtree)
+                return
+
+    def _count(self, node: _PrefixNode) -> int:
+        return 1 + sum(self._count(child) for child in node.children.values())
@@ -7,54 +7,249 @@ from ..tools._tool_parser import ToolParser
 from ..mcp._mcp_tool_parser import McpToolParser
 from mcp.types import Tool as MCPTool
 from ..conf import Conf
+from .. import _json
+from ._response_cache import _LruTtlCache, exact_cache_key, exact_cache_get, exact_cache_set
+from ._semantic_cache import semantic_cache_get, semantic_cache_set
+from .._retry import with_backoff
+from .._hashing import content_hexdigest
+from ._prefix_store import _PrefixStore
 from litellm import completion, acompletion
-from litellm import success_callback, failure_callback
-import json
+import asyncio
+import functools
+import logging
+import threading
+
+_RAG_PROMPT = None
+_http_clients_ready = False
+_configured = False
+_configure_lock = threading.Lock()
+
+
+def _ensure_configured() -> None:
+    """
+    Run the one-shot process configuration for completion calls.
+
+    Observability callbacks, logger silencing and the pooled HTTP clients
+    do not change between requests, so they are applied once at first use
+    instead of on every completion.
+    """
+    global _configured
+    if _configured:
+        return
+    with _configure_lock:
+        if _configured:
+            return
+        import litellm
+
+        observability = Conf()["observability"]
+        if len(observability) > 0:
+            litellm.success_callback = observability
+            litellm.failure_callback = observability
+
+        for logger_name in ("LiteLLM Proxy", "LiteLLM Router", "LiteLLM", "httpx"):
+            logging.getLogger(logger_name).setLevel(logging.CRITICAL + 1)
+
+        _setup_http_clients()
+        _configured = True
+
+_TOOL_PARSER = ToolParser()
+_MCP_TOOL_PARSER = McpToolParser()
+_PREFIX_STORE = _PrefixStore()
+
+
+def _prompt_cache_key(provider: str, messages) -> str:
+    """
+    Cache-routing key for multi-message conversations, None otherwise.
+
+    Only openai exposes prompt_cache_key, and single-message requests
+    carry no reusable prefix worth pinning.
+    """
+    if provider != "openai" or not isinstance(messages, list) or len(messages) < 2:
+        return None
+    return _PREFIX_STORE.key_for(messages)
+
+
+def _parse_tools(tools) -> list:
+    """Parse a toolset into litellm-ready schemas."""
+    parsed = []
+    for tool in tools:
+        if isinstance(tool, types.FunctionType):
+            parsed.append(_TOOL_PARSER.parse(tool))
+        elif isinstance(tool, MCPTool):
+            parsed.append(_MCP_TOOL_PARSER.parse(tool))
+    return parsed
+
+
+@functools.lru_cache(maxsize=128)
+def _build_response_model(response_type: type = None):
+    """
+    Build (and cache) the pydantic model used as response format.
+
+    Pydantic model creation compiles schema and validators, which is too
+    expensive to repeat per request; the compiled class is cached per
+    response type.
+    """
+    from pydantic import create_model
+    return create_model("Response", response=(response_type if response_type is not None else str, ...))
+
+
+def _setup_http_clients() -> None:
+    """
+    Configure litellm to reuse pooled httpx clients across requests.
+
+    Without this every completion may open a fresh TCP + TLS connection;
+    keep-alive pooling removes that handshake from all but the first call.
+    Runs once per process.
+    """
+    global _http_clients_ready
+    if _http_clients_ready:
+        return
+    import atexit
+    import httpx
+    import litellm
+
+    limits = httpx.Limits(max_connections=200, max_keepalive_connections=200)
+    litellm.client_session = httpx.Client(limits=limits)
+    litellm.aclient_session = httpx.AsyncClient(limits=limits)
+
+    def _close_clients():
+        litellm.client_session.close()
+        try:
+            from .._loop import run_sync
+            run_sync(litellm.aclient_session.aclose())
+        except Exception:
+            # Best effort: the shared loop may already be gone at shutdown
+            pass
+
+    atexit.register(_close_clients)
+    _http_clients_ready = True
+
+
+@functools.lru_cache(maxsize=4096)
+def _user_message(content: str) -> Dict:
+    """
+    Build (and cache) the user message dict for a prompt string.
+
+    Chat loops resend the same prompts often; caching skips one dict
+    allocation per call. The returned dict is shared, so callers must
+    wrap it in a fresh list and treat it as read-only.
+    """
+    return {"content": content, "role": "user"}
+
+
+def _as_messages(prompt) -> list:
+    """Normalize a prompt into a litellm messages list."""
+    if isinstance(prompt, str):
+        return [_user_message(prompt)]
+    return prompt
+
+
+def _rag_prompt() -> str:
+    """Get the RAG preamble from the configuration, resolved once."""
+    global _RAG_PROMPT
+    if _RAG_PROMPT is None:
+        _RAG_PROMPT = Conf()["default_prompt"]["rag"]
+    return _RAG_PROMPT
 
 class PromptExecutorMixin:
     """Mixin class to handle prompt execution."""
 
-    def _setup_observability(self):
-        observability = Conf()["observability"]
-        if (len(observability) > 0):
-            success_callback = observability 
-            failure_callback = observability 
+    def _litellm_target(self):
+        """
+        Resolve the litellm model string and base url, cached per instance.
+
+        Provider, model and url do not change after construction, so the
+        assembled strings are computed once instead of per request.
+
+        Returns:
+            Tuple of (model string, base url or None)
+        """
+        target = getattr(self, "_target_cache", None)
+        if target is None:
+            url = None
+            model = f"{self.provider}/{self.model}"
+            if getattr(self, "url", None) is not None:
+                url = f"{self.url}/v{self.version}"
+                model = "hosted_vllm/" + model
+            target = self._target_cache = (model, url)
+        return target
+
+    def _rag_query_cached(self, prompt) -> str:
+        """
+        Query the RAG and cache the flattened documents string per prompt.
+
+        The cache key includes the RAG's version attribute, bumped by
+        RAG.add on ingestion, so retrievals cached before new documents
+        arrived are not reused. Entries also expire after cache.rag_ttl
+        seconds as a backstop for ingestion paths that write to the vector
+        store directly.
+
+        Args:
+            prompt: The prompt to retrieve documents for
+
+        Returns:
+            The retrieved documents joined by newlines, empty string if none
+        """
+        if not hasattr(self, "_rag_cache"):
+            self._rag_cache = _LruTtlCache(
+                maxsize=512, ttl=Conf()["cache"].get("rag_ttl", 3600)
+            )
+        key = content_hexdigest(
+            (str(prompt) + ":" + str(getattr(self._rag, "version", 0))).encode()
+        )
+        documents = self._rag_cache.get(key)
+        if documents is None:
+            response = self._rag.query(prompt)
+            documents = '\n'.join(s for doc_list in response.get("documents", []) for s in doc_list)
+            self._rag_cache.set(key, documents)
+        return documents
+
+    def _augment_with_rag(self, prompt):
+        """
+        Augment a prompt with retrieved documents when a RAG is configured.
 
+        Args:
+            prompt: The prompt to augment
 
-    async def _execute_stream(self, prompt: Union[str, Prompt, PromptChain], metadata: Dict = None) -> AsyncGenerator[Dict, None]:
+        Returns:
+            The prompt extended with the RAG preamble and retrieved documents,
+            or the prompt unchanged when no RAG is set or nothing is retrieved
+        """
+        if getattr(self, "_rag", None):
+            documents = self._rag_query_cached(prompt)
+            if documents:
+                prompt += _rag_prompt() + documents
+        return prompt
+
+
+    def _execute_stream(self, prompt: Union[str, Prompt, PromptChain], metadata: Dict = None) -> AsyncGenerator[Dict, None]:
         """
         Execute a prompt asynchronously with streaming.
-        
+
+        Returns the underlying async iterator directly instead of
+        re-yielding each chunk, so every token pays one generator resume
+        instead of two.
+
         Args:
             prompt: The prompt to execute (string, Prompt, or PromptChain)
             metadata: Optional metadata to pass to completion calls
-            
-        Yields:
-            Dictionary containing streaming response chunks
+
+        Returns:
+            Async iterator of streaming response chunks
         """
 
         # Handle RAG if available
-        if hasattr(self, '_rag') and self._rag:
-            response = self._rag.query(prompt)
-            if len(response["documents"]) > 0:
-                documents = response.get('documents', [])
-                documents = [s for doc_list in documents for s in doc_list]
-                documents = '\n'.join(documents)
-                prompt += Conf()["default_prompt"]["rag"] + documents
+        prompt = self._augment_with_rag(prompt)
 
         # Handle different prompt types
         if isinstance(prompt, PromptChain):
-            async for chunk in self._execute_chain_stream(prompt, metadata):
-                yield chunk
+            return self._execute_chain_stream(prompt, metadata)
         elif isinstance(prompt, IterativePrompt):
-            async for chunk in self._execute_iterative_stream(prompt, metadata):
-                yield chunk
+            return self._execute_iterative_stream(prompt, metadata)
         elif isinstance(prompt, Prompt):
-            async for chunk in self._completion_stream(str(prompt), response_type=prompt.response_type, metadata=metadata):
-                yield chunk
+            return self._completion_stream(str(prompt), response_type=prompt.response_type, metadata=metadata)
         else:
-            async for chunk in self._completion_stream(prompt, metadata=metadata):
-                yield chunk
+            return self._completion_stream(prompt, metadata=metadata)
     
     def _execute(self, prompt: Union[Prompt, PromptChain], metadata: Dict = {}) -> Dict:
         """
@@ -68,13 +263,7 @@ class PromptExecutorMixin:
             Dictionary containing the response
         """
 
-        if self._rag:
-            response = self._rag.query(prompt)
-            if len(response["documents"])>0:
-                documents = response.get('documents', [])
-                documents = [s for doc_list in documents for s in doc_list]
-                documents = '\n'.join(documents)
-                prompt += Conf()["default_prompt"]["rag"] + documents
+        prompt = self._augment_with_rag(prompt)
 
         if isinstance(prompt, PromptChain):
             return self._execute_chain(prompt, metadata)
@@ -95,13 +284,7 @@ class PromptExecutorMixin:
             Dictionary containing the response
         """
 
-        if self._rag:
-            response = self._rag.query(prompt)
-            if len(response["documents"])>0:
-                documents = response.get('documents', [])
-                documents = [s for doc_list in documents for s in doc_list]
-                documents = '\n'.join(documents)
-                prompt += Conf()["default_prompt"]["rag"] + documents
+        prompt = self._augment_with_rag(prompt)
 
         if isinstance(prompt, PromptChain):
             return await self._execute_chain_async(prompt, metadata)
@@ -115,23 +298,48 @@ class PromptExecutorMixin:
     async def _execute_chain_async(self, chain: PromptChain, metadata: Dict = None) -> Dict:
         """
         Execute a prompt chain asynchronously.
-        
+
+        Chain steps are stitched into one append-only conversation so the
+        shared prefix can be reused by provider-side prompt caching instead
+        of being re-prefilled on every step. Independent chains skip the
+        conversation and run all steps concurrently instead.
+
         Args:
             chain: The prompt chain to execute
             metadata: Optional metadata to pass to completion calls
-            
+
         Returns:
-            Dictionary containing the final response
+            Dictionary containing the final response, or the list of
+            per-step responses for an independent chain
         """
+        if chain.independent:
+            prompts = [chain._format(i) for i in range(chain._size)]
+            tasks = [
+                self._completion_async(str(p), response_type=p.response_type, metadata=metadata)
+                for p in prompts
+            ]
+            return list(await asyncio.gather(*tasks))
+
+        messages = []
         response = None
         for i in range(chain._size):
-            current_prompt = chain._format(i, response.output if response else None)
-            response = await self._completion_async(current_prompt, metadata=metadata)
+            step = chain._format(i)
+            messages.append({"content": str(step), "role": "user"})
+            response = await self._completion_async(
+                messages,
+                response_type=getattr(step, "response_type", None),
+                metadata=metadata
+            )
+            messages.append({"content": response["choices"][0]["message"]["content"], "role": "assistant"})
         return response
 
     async def _execute_chain_stream(self, chain: PromptChain, metadata: Dict = None) -> AsyncGenerator[Dict, None]:
         """
         Execute a prompt chain asynchronously with streaming.
+
+        Chain steps are stitched into one append-only conversation so the
+        shared prefix can be reused by provider-side prompt caching instead
+        of being re-prefilled on every step.
         
         Args:
             chain: The promptChain to execute
@@ -140,30 +348,57 @@ class PromptExecutorMixin:
         Yields:
             Streaming response chunks from the final prompt in the chain
         """
-        response = None
+        messages = []
         for i in range(chain._size):
-            current_prompt = chain._format(i, response.output if response else None)
+            step = chain._format(i)
+            messages.append({"content": str(step), "role": "user"})
             if i == chain._size - 1:  # Last prompt in chain
-                async for chunk in self._completion_stream(current_prompt, metadata=metadata):
+                async for chunk in self._completion_stream(
+                    messages,
+                    response_type=getattr(step, "response_type", None),
+                    metadata=metadata
+                ):
                     yield chunk
-            else:  # Execute non-streaming for intermediate prompts
-                response = self._completion(current_prompt, metadata=metadata)
+            else:  # Execute non-streaming for intermediate prompts without blocking the loop
+                response = await self._completion_async(
+                    messages,
+                    response_type=getattr(step, "response_type", None),
+                    metadata=metadata
+                )
+                messages.append({"content": response["choices"][0]["message"]["content"], "role": "assistant"})
 
     def _execute_chain(self, chain: PromptChain, metadata: Dict = None) -> Dict:
         """
         Execute a prompt chain synchronously.
-        
+
+        Chain steps are stitched into one append-only conversation so the
+        shared prefix can be reused by provider-side prompt caching instead
+        of being re-prefilled on every step. Independent chains run all
+        steps concurrently on the shared background loop.
+
         Args:
             chain: The prompt chain to execute
             metadata: Optional metadata to pass to completion calls
-            
+
         Returns:
-            Dictionary containing the final response
+            Dictionary containing the final response, or the list of
+            per-step responses for an independent chain
         """
+        if chain.independent:
+            from .._loop import run_sync
+            return run_sync(self._execute_chain_async(chain, metadata))
+
+        messages = []
         response = None
         for i in range(chain._size):
-            current_prompt = chain._format(i, json.loads(response["choices"][0]["message"]["content"])["response"] if response else None)
-            response = self._completion(current_prompt, metadata=metadata)
+            step = chain._format(i)
+            messages.append({"content": str(step), "role": "user"})
+            response = self._completion(
+                messages,
+                metadata=metadata,
+                response_type=getattr(step, "response_type", None)
+            )
+            messages.append({"content": response["choices"][0]["message"]["content"], "role": "assistant"})
         return response
     
     def _execute_iterative(self, prompt: IterativePrompt, metadata: Dict = None) -> Dict:
@@ -219,64 +454,78 @@ class PromptExecutorMixin:
             if i == prompt._size - 1:  # Last iteration
                 async for chunk in self._completion_stream(current_prompt, metadata=metadata):
                     yield chunk
-            else:  # Execute non-streaming for intermediate iterations
-                current_response = self._completion(current_prompt, metadata=metadata)
+            else:  # Execute non-streaming for intermediate iterations without blocking the loop
+                current_response = await self._completion_async(str(current_prompt), metadata=metadata)
                 response += current_response
 
     def _get_tools(self):
-        tools = None
-        if hasattr(self, "_tools") and len(self._tools) > 0:
-            tools = []
-            tp = ToolParser()
-            mcp_tp = McpToolParser()
-            for tool in self._tools:
-                if isinstance(tool, types.FunctionType):
-                    tools.append(tp.parse(tool))      
-                elif isinstance(tool, MCPTool):
-                    tools.append(mcp_tp.parse(tool))
+        # Schemas precomputed when the toolset was registered via _add_tools
+        spec = getattr(self, "_tools_spec", None)
+        if spec is not None:
+            return spec
+        # Fallback for toolsets assigned directly to _tools
+        if not hasattr(self, "_tools") or len(self._tools) == 0:
+            return None
+        # Reparse only when the registered toolset changes identity
+        if getattr(self, "_tools_cache_key", None) == id(self._tools):
+            return self._tools_cache
+        tools = _parse_tools(self._tools)
+        self._tools_cache_key = id(self._tools)
+        self._tools_cache = tools
         return tools
 
-    def _completion(self, prompt: Prompt|list, metadata: Dict = {}) -> Dict:
+    @with_backoff
+    def _completion(self, prompt: Prompt|list, metadata: Dict = {}, response_type: type = None) -> Dict:
 
-        self._setup_observability()
-        from pydantic import BaseModel
+        _ensure_configured()
 
-        class Response(BaseModel):
-            response: prompt.response_type if prompt.response_type is not None else str
+        if response_type is None:
+            response_type = getattr(prompt, "response_type", None)
+        Response = _build_response_model(response_type)
 
-        self._disable_logging()
 
-        url = None
-        model = self.provider+"/"+self.model
-        
-        if hasattr(self, "url") and self.url != None:
-            url = self.url+"/v"+str(self.version)
-            model = "hosted_vllm/"+model
-        
+        model, url = self._litellm_target()
+
         tools = self._get_tools()
 
-        if isinstance(prompt, Prompt):  
+        if isinstance(prompt, Prompt):
             messages = [prompt.as_dict()]
         else:
             messages = prompt
-        
+
         """
         if self._web_search:
             web_search_config = {"search_context_size": self._web_search}
         else:
             web_search_config = None
         """
-        print(messages)
-        response = completion(model=model, 
-                          messages=messages, 
+        cache_key = exact_cache_key(model, messages, response_type, tools, self._max_tokens)
+        cached = exact_cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Semantic lookups only make sense for standalone prompts; the
+        # near-identical reprs of a growing conversation would match each
+        # other across steps
+        use_semantic = tools is None and isinstance(prompt, Prompt)
+        if use_semantic:
+            cached = semantic_cache_get(model, str(prompt))
+            if cached is not None:
+                return cached
+
+        response = completion(model=model,
+                          messages=messages,
                           response_format=Response,
                           base_url = url,
                           tools=tools,
                           max_tokens=self._max_tokens,
                           metadata=metadata,
+                          prompt_cache_key=_prompt_cache_key(getattr(self, "provider", None), messages),
                           #web_search_options=web_search_config
                           )
-        print("Completion response:", response)
+        exact_cache_set(cache_key, response)
+        if use_semantic:
+            semantic_cache_set(model, str(prompt), response)
         return response
 
     async def _completion_stream(self, prompt: str|list, response_type: str = None, metadata: Dict = None) -> AsyncGenerator[Dict, None]:
@@ -291,29 +540,22 @@ class PromptExecutorMixin:
         Yields:
             Streaming response chunks
         """
-        self._setup_observability()
-        url = None
-        model = self.provider+"/"+self.model
-        if hasattr(self, "url") and self.url != None:
-            url = self.url+"/v"+str(self.version)
-            model = "hosted_vllm/"+model
+        _ensure_configured()
+        model, url = self._litellm_target()
         
         tools = self._get_tools()
 
-        if isinstance(prompt, str):
-            messages = [{ "content": prompt,"role": "user"}]
-        else:
-            messages = prompt
+        messages = _as_messages(prompt)
 
-        self._disable_logging()
         from litellm import acompletion
 
         response = await acompletion(
-            model=model, 
-            messages=messages, 
+            model=model,
+            messages=messages,
             response_format=response_type,
             base_url=url,
             stream=True,
+            stream_options={"include_usage": True},
             max_tokens=self._max_tokens,
             metadata=metadata,
             tools=tools
@@ -349,69 +591,58 @@ class PromptExecutorMixin:
             response += current_response
         return response
 
-    async def _completion_async(self, prompt: str|list, response_type: str = None, metadata: Dict = None) -> Dict:
+    @with_backoff
+    async def _completion_async(self, prompt: str|list, response_type: str = None, metadata: Dict = None, n: int = None) -> Dict:
         """
         Execute a completion asynchronously.
-        
+
         Args:
             prompt: The prompt to execute
             response_type: Optional response type
             metadata: Optional metadata to pass to completion call
-            
+            n: Optional number of completions to request in one call
+
         Returns:
             Dictionary containing the response
         """
-        self._setup_observability()
-        from pydantic import BaseModel
-
-        class Response(BaseModel):
-            response: response_type
+        _ensure_configured()
 
+        raw_response_type = response_type
         if response_type!=None:
-            response_type = Response
+            response_type = _build_response_model(response_type)
 
-        self._disable_logging()
 
-        url = None
-        model = self.provider+"/"+self.model
-        
-        if hasattr(self, "url") and self.url != None:
-            url = self.url+"/v"+str(self.version)
-            model = "hosted_vllm/"+model
-        
-        tools = None
+        model, url = self._litellm_target()
 
-        if hasattr(self, "_tools"):
-            tools = []
-            tp = ToolParser()
-            for tool in self._tools:
-                tools.append(tp.parse(tool))      
+        tools = self._get_tools()
 
-        if isinstance(prompt, str):
-            messages = [{ "content": prompt,"role": "user"}]
-        else:
-            messages = prompt
+        messages = _as_messages(prompt)
+
+        if n is None:
+            cache_key = exact_cache_key(model, messages, raw_response_type, tools, self._max_tokens)
+            cached = exact_cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+            if tools is None and isinstance(prompt, str):
+                cached = semantic_cache_get(model, prompt)
+                if cached is not None:
+                    return cached
 
         from litellm import acompletion
-        return await acompletion(model=model, 
-                                messages=messages, 
+        response = await acompletion(model=model,
+                                messages=messages,
                                 response_format=response_type,
                                 base_url = url,
                                 tools=tools,
                                 max_tokens=self._max_tokens,
-                                metadata=metadata)
-            
+                                metadata=metadata,
+                                prompt_cache_key=_prompt_cache_key(getattr(self, "provider", None), messages),
+                                n=n)
+        if n is None:
+            exact_cache_set(cache_key, response)
+            if tools is None and isinstance(prompt, str):
+                semantic_cache_set(model, prompt, response)
+        return response
 
-    def _disable_logging(self):
-        import logging
-        loggers = [
-            "LiteLLM Proxy",
-            "LiteLLM Router",
-            "LiteLLM",
-            "httpx"
-        ]
-
-        for logger_name in loggers:
-            logger = logging.getLogger(logger_name)
-            logger.setLevel(logging.CRITICAL + 1) 
 
@@ -0,0 +1,174 @@
+"""Exact-match response cache for completion calls."""
+
+import copy
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..conf import Conf
+from .. import _json
+from .._hashing import content_hexdigest
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class _LruTtlCache:
+    """A small LRU cache whose entries expire after a time-to-live."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = float("inf")):
+        """
+        Initialize the cache.
+
+        Parameters
+        ----------
+        maxsize : int
+            Maximum number of entries kept in the cache
+        ttl : float
+            Time-to-live of each entry, in seconds. Defaults to no expiry,
+            which makes the cache a plain LRU.
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, stored_at = entry
+        if time.monotonic() - stored_at > self._ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        self._entries.clear()
+
+
+_exact_cache: Optional[_LruTtlCache] = None
+
+
+def _exact_cache_enabled() -> bool:
+    """Check whether the exact-match cache is enabled in the configuration."""
+    cache_conf = Conf()["cache"]
+    return bool(cache_conf.get("exact", False))
+
+
+def _get_exact_cache() -> _LruTtlCache:
+    """Get or lazily create the process-wide exact-match cache."""
+    global _exact_cache
+    if _exact_cache is None:
+        cache_conf = Conf()["cache"]
+        _exact_cache = _LruTtlCache(
+            maxsize=cache_conf.get("exact_maxsize", 1024),
+            ttl=cache_conf.get("exact_ttl", 3600)
+        )
+    return _exact_cache
+
+
+def _normalize_text(text: str) -> str:
+    """Normalize text to NFKC and collapse runs of whitespace."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+def _normalize_messages(messages: List[Dict]) -> List[Dict]:
+    """Return messages with textual content normalized for key building."""
+    normalized = []
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, str):
+            message = {**message, "content": _normalize_text(content)}
+        normalized.append(message)
+    return normalized
+
+
+def exact_cache_key(model: str,
+                    messages: List[Dict],
+                    response_format: type = None,
+                    tools: List[Dict] = None,
+                    max_tokens: int = None) -> str:
+    """
+    Build a stable hash of the completion inputs.
+
+    Two calls with identical model, messages, response format, tools and
+    max_tokens map to the same key. Message text is normalized (NFKC,
+    collapsed whitespace) so trivial formatting differences still hit.
+    """
+    payload = _json.dumps({
+        "model": model,
+        "messages": _normalize_messages(messages),
+        "rf": response_format.__name__ if response_format is not None else None,
+        "tools": tools,
+        "max_tokens": max_tokens
+    }, sort_keys=True, default=str)
+    return content_hexdigest(payload)
+
+
+_disk_cache: Optional[Any] = None
+
+
+def _disk_cache_enabled() -> bool:
+    """Check whether on-disk persistence of the exact cache is enabled."""
+    return bool(Conf()["cache"].get("disk", False))
+
+
+def _get_disk_cache() -> Any:
+    """Get or lazily create the on-disk cache."""
+    global _disk_cache
+    if _disk_cache is None:
+        try:
+            import diskcache
+        except ImportError:
+            raise ImportError(
+                "diskcache package is required for the on-disk response "
+                "cache. Install it with: pip install diskcache"
+            )
+        cache_conf = Conf()["cache"]
+        path = Path(cache_conf.get("disk_path", "~/.aidk/cache")).expanduser()
+        _disk_cache = diskcache.Cache(
+            str(path),
+            size_limit=cache_conf.get("disk_size_limit", 2 ** 31)
+        )
+    return _disk_cache
+
+
+def exact_cache_get(key: str) -> Optional[Any]:
+    """Return a copy of the cached response for key, or None on miss."""
+    if not _exact_cache_enabled():
+        return None
+    response = _get_exact_cache().get(key)
+    if response is None and _disk_cache_enabled():
+        response = _get_disk_cache().get(key)
+        if response is not None:
+            # Promote disk hits so reruns stay in memory
+            _get_exact_cache().set(key, response)
+    if response is None:
+        return None
+    return copy.deepcopy(response)
+
+
+def exact_cache_set(key: str, response: Any) -> None:
+    """Store a copy of a completion response under key."""
+    if not _exact_cache_enabled():
+        return
+    _get_exact_cache().set(key, copy.deepcopy(response))
+    if _disk_cache_enabled():
+        ttl = Conf()["cache"].get("exact_ttl", 3600)
+        _get_disk_cache().set(
+            key,
+            copy.deepcopy(response),
+            expire=None if ttl == float("inf") else ttl
+        )
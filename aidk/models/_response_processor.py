@@ -1,24 +1,23 @@
 from typing import Dict
 from ..prompts.prompt import Prompt
 from dataclasses import dataclass
-from decimal import Decimal
-import json
+from .. import _json
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Model:
     """Model information."""
     provider: str
     name: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelUsage:
     """Model usage statistics."""
     completion_tokens: int
     prompt_tokens: int
     total_tokens: int
-    cost: Decimal
+    cost: float
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelResponse:
     """Model response."""
     prompt: str
@@ -26,17 +25,17 @@ class ModelResponse:
     model: Model
     usage:ModelUsage = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelStreamHead:
     """Model response head for streaming."""
     model: Model
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelStreamChunk:
     """Model response chunk for streaming."""
     delta: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelStreamTail:
     """Model response tail for streaming."""
     prompt: str
@@ -44,6 +43,44 @@ class ModelStreamTail:
     model: Model
     usage: ModelUsage
 
+def aggregate_usage(responses) -> ModelUsage:
+    """
+    Sum token counts and cost across responses in a single pass.
+
+    Call sites accumulating usage over many responses (multi-model
+    fan-outs, agent loops) should aggregate once at the end with this
+    instead of updating running totals per call.
+
+    Parameters
+    ----------
+    responses : iterable
+        ModelResponse or ModelStreamTail objects; entries without usage
+        (exceptions, streamed heads) are skipped
+
+    Returns
+    -------
+    ModelUsage
+        Total usage across all responses
+    """
+    completion_tokens = 0
+    prompt_tokens = 0
+    cost = 0.0
+    for response in responses:
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            continue
+        completion_tokens += usage.completion_tokens
+        prompt_tokens += usage.prompt_tokens
+        if usage.cost is not None:
+            cost += usage.cost
+    return ModelUsage(
+        completion_tokens=completion_tokens,
+        prompt_tokens=prompt_tokens,
+        total_tokens=completion_tokens + prompt_tokens,
+        cost=round(cost, 8)
+    )
+
+
 class ResponseProcessorMixin:
     def _process_response(
         self,
@@ -67,8 +104,9 @@ class ResponseProcessorMixin:
 
         response_content = response.choices[0].message.content
         if '"response":' in response_content:
-            response_content = json.loads(response_content)["response"]
+            response_content = _json.loads(response_content)["response"]
 
+        cost = response._hidden_params.get("response_cost")
         return ModelResponse(
             prompt=str(prompt),
             response=response_content,
@@ -77,7 +115,7 @@ class ResponseProcessorMixin:
                 completion_tokens=response.usage.completion_tokens,
                 prompt_tokens=response.usage.prompt_tokens,
                 total_tokens=response.usage.total_tokens,
-                cost = round(Decimal(response._hidden_params["response_cost"]), 8)
+                cost = round(cost, 8) if cost is not None else None
             ),
         )
 
@@ -87,8 +125,11 @@ class ResponseProcessorMixin:
         )
 
     def _process_stream_chunk(self, chunk):
-        return ModelStreamChunk(
-            delta=chunk.choices[0].delta.content)
+        # Fast path: skip dataclass construction for contentless chunks
+        delta = chunk.choices[0].delta.content
+        if delta is None:
+            return None
+        return ModelStreamChunk(delta=delta)
     
     def _process_stream_tail(self, chunk, prompt, response):
         return ModelStreamTail(
@@ -99,6 +140,6 @@ class ResponseProcessorMixin:
                 completion_tokens=chunk.usage.completion_tokens,
                 prompt_tokens=chunk.usage.prompt_tokens,
                 total_tokens=chunk.usage.total_tokens,
-                cost = round(Decimal(chunk._hidden_params["response_cost"]), 8) if chunk._hidden_params["response_cost"]!=None else None
+                cost = round(chunk._hidden_params["response_cost"], 8) if chunk._hidden_params["response_cost"]!=None else None
             ),
         )
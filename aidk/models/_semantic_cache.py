@@ -0,0 +1,104 @@
+"""Semantic (embedding-similarity) response cache for completion calls."""
+
+import copy
+from typing import Any, Dict, Optional
+
+from ..conf import Conf
+
+_EMBEDDING_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+_EMBEDDING_DIM = 384
+
+_embedding_model = None
+_caches: Dict[str, "_SemanticCache"] = {}
+
+
+def _get_embedding_model():
+    """Get or lazily load the local sentence-transformers embedding model."""
+    global _embedding_model
+    if _embedding_model is None:
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            raise ImportError("sentence-transformers is not installed. Please install it with 'pip install sentence-transformers'")
+        _embedding_model = SentenceTransformer(_EMBEDDING_MODEL_NAME)
+    return _embedding_model
+
+
+class _SemanticCache:
+    """An approximate-nearest-neighbour cache of prompt embeddings and responses."""
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Initialize the cache.
+
+        Parameters
+        ----------
+        maxsize : int
+            Maximum number of entries kept in the index
+        """
+        try:
+            import hnswlib
+        except ImportError:
+            raise ImportError("hnswlib is not installed. Please install it with 'pip install hnswlib'")
+
+        self._maxsize = maxsize
+        self._index = hnswlib.Index(space="cosine", dim=_EMBEDDING_DIM)
+        self._index.init_index(max_elements=maxsize, ef_construction=200, M=16)
+        self._responses: Dict[int, Any] = {}
+        self._next_id = 0
+
+    def get(self, vector, threshold: float) -> Optional[Any]:
+        """Return the stored response whose prompt is most similar to vector,
+        or None if nothing reaches the similarity threshold."""
+        if self._index.get_current_count() == 0:
+            return None
+        labels, distances = self._index.knn_query(vector, k=1)
+        if 1 - distances[0][0] >= threshold:
+            return self._responses.get(int(labels[0][0]))
+        return None
+
+    def add(self, vector, response: Any) -> None:
+        """Store a response under its prompt embedding."""
+        if self._next_id >= self._maxsize:
+            return
+        self._index.add_items(vector, [self._next_id])
+        self._responses[self._next_id] = response
+        self._next_id += 1
+
+
+def _semantic_cache_enabled() -> bool:
+    """Check whether the semantic cache is enabled in the configuration."""
+    return bool(Conf()["cache"].get("semantic", False))
+
+
+def _get_cache(model_id: str) -> _SemanticCache:
+    """Get or lazily create the cache for a provider/model pair."""
+    cache = _caches.get(model_id)
+    if cache is None:
+        cache = _SemanticCache(maxsize=Conf()["cache"].get("semantic_maxsize", 1024))
+        _caches[model_id] = cache
+    return cache
+
+
+def _embed(prompt_text: str):
+    """Embed a prompt as a normalized vector."""
+    return _get_embedding_model().encode(prompt_text, normalize_embeddings=True)
+
+
+def semantic_cache_get(model_id: str, prompt_text: str) -> Optional[Any]:
+    """Return a copy of the cached response for a semantically similar prompt,
+    or None on miss or when the cache is disabled."""
+    if not _semantic_cache_enabled():
+        return None
+    threshold = Conf()["cache"].get("semantic_threshold", 0.95)
+    response = _get_cache(model_id).get(_embed(prompt_text), threshold)
+    if response is None:
+        return None
+    return copy.deepcopy(response)
+
+
+def semantic_cache_set(model_id: str, prompt_text: str, response: Any) -> None:
+    """Store a copy of a completion response under the prompt's embedding."""
+    if not _semantic_cache_enabled():
+        return
+    _get_cache(model_id).add(_embed(prompt_text), copy.deepcopy(response))
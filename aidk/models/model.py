@@ -99,6 +99,9 @@ class Model(BaseModel, ResponseProcessorMixin, PromptExecutorMixin):
         if metadata is None:
             metadata = {}
         response = await self._execute_async(prompt, metadata)
+        if isinstance(response, list):
+            # Independent chain: one response per step
+            return [self._process_response(p, r) for p, r in zip(prompt, response)]
         return self._process_response(
             prompt,
             response,
@@ -131,11 +134,11 @@ class Model(BaseModel, ResponseProcessorMixin, PromptExecutorMixin):
                 yield self._process_stream_tail(chunk, prompt, response)
             else:
                 processed_chunk = self._process_stream_chunk(chunk)
-                if processed_chunk.delta is not None:
+                if processed_chunk is not None:
                     response += processed_chunk.delta
                     yield processed_chunk
 
-    def ask(self, prompt: Union[str, Prompt, PromptChain], metadata: Dict = None) -> Dict:
+    def ask(self, prompt: Union[str, Prompt, PromptChain], metadata: Dict = None, stream: bool = False) -> Dict:
         """
         Ask the model.
 
@@ -145,6 +148,11 @@ class Model(BaseModel, ResponseProcessorMixin, PromptExecutorMixin):
             The prompt to process
         metadata : Dict, optional
             Metadata to pass to the completion call
+        stream : bool, optional
+            If True, return the async generator from ask_stream instead of
+            waiting for the full completion, cutting time-to-first-token
+            from full-completion latency to roughly prefill latency.
+            Defaults to False.
 
         Returns
         -------
@@ -153,12 +161,20 @@ class Model(BaseModel, ResponseProcessorMixin, PromptExecutorMixin):
             - prompt: The original prompt
             - model: Dictionary with provider and model name
             - usage: Token counts and cost
+
+            When stream=True, an async generator of ModelStreamHead,
+            ModelStreamChunk and ModelStreamTail instead.
         """
         if metadata is None:
             metadata = {}
+        if stream:
+            return self.ask_stream(prompt, metadata)
         if isinstance(prompt, str):
             prompt = Prompt(prompt=prompt)
         response = self._execute(prompt, metadata)
+        if isinstance(response, list):
+            # Independent chain: one response per step
+            return [self._process_response(p, r) for p, r in zip(prompt, response)]
         return self._process_response(
             prompt,
             response
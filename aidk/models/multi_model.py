@@ -1,8 +1,13 @@
 """Multi model for parallel execution across multiple AI models."""
 
 import asyncio
+import copy
+import logging
 from typing import Dict, List, Union
 
+from .._loop import run_sync
+from .. import _json
+
 from ..prompts.prompt import Prompt
 from ..prompts.prompt_chain import PromptChain
 
@@ -11,6 +16,8 @@ from ._prompt_executor import PromptExecutorMixin
 from ._response_processor import ResponseProcessorMixin
 from .model import Model
 
+logger = logging.getLogger(__name__)
+
 
 class MultiModel(BaseModel, PromptExecutorMixin, ResponseProcessorMixin):
     """
@@ -41,7 +48,11 @@ class MultiModel(BaseModel, PromptExecutorMixin, ResponseProcessorMixin):
 
     def __init__(
         self,
-        models: List[Dict[str, str]]
+        models: List[Dict[str, str]],
+        max_concurrency: int = 32,
+        dedupe_identical_models: bool = True,
+        batch_duplicates_with_n: bool = True,
+        mode: str = "online"
     ):
         """
         Initialize a new MultiModel instance.
@@ -50,16 +61,100 @@ class MultiModel(BaseModel, PromptExecutorMixin, ResponseProcessorMixin):
         ----------
         models : List[Dict[str, str]]
             List of dictionaries with provider and model information
+        max_concurrency : int, optional
+            Maximum number of models queried concurrently. Defaults to 32.
+        dedupe_identical_models : bool, optional
+            If True, entries sharing the same provider and model issue a
+            single request whose response is fanned out to each position.
+            Defaults to True.
+        batch_duplicates_with_n : bool, optional
+            If True, duplicate provider/model entries request n completions
+            in one call: the provider computes the shared prefill once and
+            samples n times, and each position gets a distinct sample.
+            Only applies to plain string or Prompt prompts on providers
+            supporting the n parameter; other duplicates fall back to the
+            dedupe/copy path. Defaults to True.
+        mode : str, optional
+            "online" sends normal completion requests. "batch" routes the
+            fan-out through the provider's Batch API, which is cheaper and
+            exempt from online rate limits but has minutes-scale turnaround;
+            ask() blocks until the batch completes. Batch mode requires all
+            models to share a provider with a Batch API (e.g. openai) and
+            supports plain string or Prompt prompts. Defaults to "online".
         """
         super().__init__()
+        if mode not in ("online", "batch"):
+            raise ValueError(f"Unknown mode: {mode}")
         self._models = [
             Model(
                 provider=model['provider'],
                 model=model['model']
             ) for model in models
         ]
+        self._max_concurrency = max_concurrency
+        self._dedupe_identical_models = dedupe_identical_models
+        self._batch_duplicates_with_n = batch_duplicates_with_n
+        self._mode = mode
+
+    @staticmethod
+    def _supports_n(model: Model) -> bool:
+        """Check whether the model's provider accepts the n parameter."""
+        try:
+            import litellm
+            params = litellm.get_supported_openai_params(
+                model=model.model, custom_llm_provider=model.provider
+            )
+            return params is not None and "n" in params
+        except Exception:
+            return False
 
-    async def _task(self, model: Model, prompt: Union[str, Prompt, PromptChain]) -> Dict:
+    async def _task_n(self, model: Model, prompt: Union[str, Prompt], semaphore: asyncio.Semaphore, n: int) -> List[Dict]:
+        """
+        Request n completions from one model in a single call.
+
+        Parameters
+        ----------
+        model : Model
+            The model instance to use
+        prompt : Union[str, Prompt]
+            The prompt to process
+        semaphore : asyncio.Semaphore
+            Concurrency guard shared with the other tasks
+        n : int
+            Number of completions to request
+
+        Returns
+        -------
+        List[Dict]
+            One processed response per requested completion
+        """
+        async with semaphore:
+            response = await model._completion_async(
+                str(prompt),
+                response_type=getattr(prompt, "response_type", None),
+                n=n
+            )
+        # Apportion the shared usage so the split responses sum to the
+        # actual request: completion tokens are split evenly across the
+        # choices, while the once-computed prompt tokens and cost are
+        # attributed to the first position only.
+        usage = response.usage
+        share, remainder = divmod(usage.completion_tokens, len(response.choices))
+        cost = response._hidden_params.get("response_cost")
+        results = []
+        for i, choice in enumerate(response.choices):
+            single = copy.copy(response)
+            single.choices = [choice]
+            single.usage = copy.deepcopy(usage)
+            single.usage.completion_tokens = share + (remainder if i == 0 else 0)
+            single.usage.prompt_tokens = usage.prompt_tokens if i == 0 else 0
+            single.usage.total_tokens = single.usage.prompt_tokens + single.usage.completion_tokens
+            single._hidden_params = dict(response._hidden_params)
+            single._hidden_params["response_cost"] = cost if i == 0 else 0.0
+            results.append(model._process_response(prompt, single))
+        return results
+
+    async def _task(self, model: Model, prompt: Union[str, Prompt, PromptChain], semaphore: asyncio.Semaphore) -> Dict:
         """
         Execute a single model task asynchronously.
 
@@ -80,13 +175,110 @@ class MultiModel(BaseModel, PromptExecutorMixin, ResponseProcessorMixin):
             - tokens: Token counts (if enabled)
             - cost: Cost calculation (if enabled)
         """
-        response = await self._execute_async(prompt, metadata=None)
-        return self._process_response(
+        async with semaphore:
+            response = await model._execute_async(prompt, metadata=None)
+        return model._process_response(
             prompt,
             response
         )
 
-    async def _ask_async(self, prompt: Union[str, Prompt, PromptChain]) -> List[Dict]:
+    async def _ask_batch_async(self, prompt: Union[str, Prompt]) -> List[Dict]:
+        """
+        Fan the prompt out through the provider's Batch API.
+
+        One JSONL request per model is uploaded as a single batch job,
+        which is then polled until completion and demultiplexed back into
+        one response per model, in the original model order.
+
+        Parameters
+        ----------
+        prompt : Union[str, Prompt]
+            The prompt to process across all models
+
+        Returns
+        -------
+        List[Dict]
+            List of response dictionaries, one per model
+        """
+        import litellm
+
+        if isinstance(prompt, PromptChain):
+            raise ValueError("Batch mode does not support prompt chains")
+        providers = {model.provider for model in self._models}
+        if providers != {"openai"}:
+            raise ValueError(
+                "Batch mode requires all models to use the openai provider"
+            )
+
+        lines = []
+        for i, model in enumerate(self._models):
+            body = {
+                "model": model.model,
+                "messages": [{"content": str(prompt), "role": "user"}]
+            }
+            if model._max_tokens is not None:
+                body["max_tokens"] = model._max_tokens
+            lines.append(_json.dumps({
+                "custom_id": f"aidk-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body
+            }))
+
+        input_file = await litellm.acreate_file(
+            file=b"\n".join(lines),
+            purpose="batch",
+            custom_llm_provider="openai"
+        )
+        batch = await litellm.acreate_batch(
+            completion_window="24h",
+            endpoint="/v1/chat/completions",
+            input_file_id=input_file.id,
+            custom_llm_provider="openai"
+        )
+
+        # Poll with exponential backoff: batches settle in minutes, so
+        # start at 5 s and cap the interval at 60 s.
+        delay = 5
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 60)
+            batch = await litellm.aretrieve_batch(
+                batch_id=batch.id,
+                custom_llm_provider="openai"
+            )
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} ended with status {batch.status}")
+
+        output = await litellm.afile_content(
+            file_id=batch.output_file_id,
+            custom_llm_provider="openai"
+        )
+        results = {}
+        for line in output.content.splitlines():
+            if not line.strip():
+                continue
+            entry = _json.loads(line)
+            results[entry["custom_id"]] = entry
+        responses = []
+        for i, model in enumerate(self._models):
+            entry = results.get(f"aidk-{i}")
+            if entry is None or entry.get("error") or entry["response"]["status_code"] != 200:
+                raise RuntimeError(f"Batch request for model {model.model} failed: {entry}")
+            response = litellm.ModelResponse(**entry["response"]["body"])
+            # Rebuilt responses carry no hidden params, so the cost litellm
+            # normally attaches per call is computed here (at batch pricing
+            # the real spend is about half of this online-rate estimate)
+            try:
+                response._hidden_params["response_cost"] = litellm.completion_cost(
+                    completion_response=response
+                )
+            except Exception:
+                response._hidden_params["response_cost"] = None
+            responses.append(model._process_response(prompt, response))
+        return responses
+
+    async def _ask_async(self, prompt: Union[str, Prompt, PromptChain], return_exceptions: bool = False) -> List[Dict]:
         """
         Ask all models asynchronously.
 
@@ -94,6 +286,9 @@ class MultiModel(BaseModel, PromptExecutorMixin, ResponseProcessorMixin):
         ----------
         prompt : Union[str, Prompt, PromptChain]
             The prompt to process across all models
+        return_exceptions : bool, optional
+            If True, a failing model yields its exception in the result
+            list instead of aborting the whole fan-out. Defaults to False.
 
         Returns
         -------
@@ -112,10 +307,67 @@ class MultiModel(BaseModel, PromptExecutorMixin, ResponseProcessorMixin):
             >>> for resp in responses:
             ...     print(f"{resp['model']['name']}: {resp['response']}")
         """
-        tasks = [self._task(model, prompt) for model in self._models]
-        return await asyncio.gather(*tasks)
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        if isinstance(prompt, PromptChain) and prompt.independent:
+            # Independent chain items don't feed each other, so every
+            # (model, prompt) pair can run concurrently; results are
+            # regrouped per model, one list of responses each.
+            tasks = [
+                self._task(model, item, semaphore)
+                for model in self._models for item in prompt
+            ]
+            flat = await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+            return [
+                list(flat[i * prompt._size:(i + 1) * prompt._size])
+                for i in range(len(self._models))
+            ]
+
+        if not self._dedupe_identical_models:
+            tasks = [self._task(model, prompt, semaphore) for model in self._models]
+            return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+
+        # Group positions sharing the same provider/model so duplicates
+        # issue a single request whose response is fanned out afterwards.
+        groups: Dict[tuple, List[int]] = {}
+        for i, model in enumerate(self._models):
+            key = (model.provider, model.model, getattr(model, "url", None))
+            groups.setdefault(key, []).append(i)
+
+        batch_with_n = (
+            self._batch_duplicates_with_n
+            and isinstance(prompt, (str, Prompt))
+        )
+
+        tasks = []
+        for indices in groups.values():
+            model = self._models[indices[0]]
+            if batch_with_n and len(indices) > 1 and self._supports_n(model):
+                logger.info(
+                    "Collapsing %d duplicate %s/%s entries into one request with n=%d",
+                    len(indices), model.provider, model.model, len(indices)
+                )
+                tasks.append(self._task_n(model, prompt, semaphore, len(indices)))
+            else:
+                tasks.append(self._task(model, prompt, semaphore))
+        responses = await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+
+        out = [None] * len(self._models)
+        for indices, response in zip(groups.values(), responses):
+            if isinstance(response, Exception):
+                for i in indices:
+                    out[i] = response
+            elif isinstance(response, list):
+                # One distinct sample per grouped position; pad with copies
+                # if the provider returned fewer choices than requested
+                for pos, i in enumerate(indices):
+                    out[i] = response[pos] if pos < len(response) else copy.deepcopy(response[0])
+            else:
+                for i in indices:
+                    out[i] = response if i == indices[0] else copy.deepcopy(response)
+        return out
 
-    def ask(self, prompt: Union[str, Prompt]) -> List[Dict]:
+    def ask(self, prompt: Union[str, Prompt], return_exceptions: bool = False) -> List[Dict]:
         """
         Ask all models.
 
@@ -123,6 +375,9 @@ class MultiModel(BaseModel, PromptExecutorMixin, ResponseProcessorMixin):
         ----------
         prompt : Union[str, Prompt]
             The prompt to process across all models
+        return_exceptions : bool, optional
+            If True, a failing model yields its exception in the result
+            list instead of aborting the whole fan-out. Defaults to False.
 
         Returns
         -------
@@ -135,7 +390,11 @@ class MultiModel(BaseModel, PromptExecutorMixin, ResponseProcessorMixin):
             - cost: Cost calculation (if enabled)
 
         """
-        return asyncio.run(self._ask_async(prompt))
+        # The shared loop lives on its own thread, so this works both from
+        # plain sync code and from callers already inside an event loop.
+        if self._mode == "batch":
+            return run_sync(self._ask_batch_async(prompt))
+        return run_sync(self._ask_async(prompt, return_exceptions=return_exceptions))
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
+import sys
 from typing import List
 from .prompt import Prompt, _PromptParser
+from .._hashing import content_hexdigest
 
 class PromptChain(Prompt):
 
@@ -39,11 +41,12 @@ class PromptChain(Prompt):
     ```
     """
 
-    def __init__(self, 
+    def __init__(self,
                  promptchain_id: str = None,
                  prompts_data: list[dict] = None,
                  prompts: List[Prompt] = None,
-                 response_type: type | None = None):
+                 response_type: type | None = None,
+                 independent: bool = False):
 
         """
         Initialize a new PromptChain instance.
@@ -56,6 +59,9 @@ class PromptChain(Prompt):
             List of dictionaries containing formatting data for each prompt
         prompts : List[Prompt], optional
             Direct list of Prompt objects to form the chain if promptchain_id is not provided
+        independent : bool, optional
+            If True, the prompts do not depend on each other's responses
+            and may be executed concurrently. Defaults to False.
 
         Raises
         ------
@@ -70,8 +76,93 @@ class PromptChain(Prompt):
             self._prompts = prompts
         else:
             raise ValueError("Either promptchain_id or prompts must be provided")
+        # Plain-string steps are interned so identical steps across chains
+        # share one object and compare by pointer.
+        self._prompts = [
+            sys.intern(prompt) if isinstance(prompt, str) else prompt
+            for prompt in self._prompts
+        ]
         self._size = len(self._prompts)
         self.response_type = response_type
+        self.independent = independent
+        self._joined = None
+        self._hash = None
+        self._token_counts = {}
+        self._parts = None
+
+    def __iter__(self):
+        """Iterate over the prompts in the chain."""
+        return iter(self._prompts)
+
+    def _step_strings(self) -> List[str]:
+        """Get the string form of each step, converted once and reused."""
+        if self._parts is None:
+            self._parts = [str(prompt) for prompt in self._prompts]
+        return self._parts
+
+    def precompute(self, model: str = None) -> None:
+        """
+        Build the joined string, content digest and token counts in one pass.
+
+        The three are otherwise computed lazily on first use, each walking
+        the chain; call this once up front when all of them are needed
+        (e.g. caching plus rate limiting plus the request body itself).
+
+        Parameters
+        ----------
+        model : str, optional
+            Model whose encoder to use for token counts; counts are
+            skipped if omitted
+        """
+        parts = self._step_strings()
+        if self._joined is None:
+            self._joined = "\n".join(parts)
+        if self._hash is None:
+            self._hash = content_hexdigest(self._joined.encode())
+        if model is not None and model not in self._token_counts:
+            from ..tokens import TokenCounter
+            self._token_counts[model] = TokenCounter().count_batch(model, parts)
+
+    @property
+    def hash(self) -> str:
+        """
+        Get a 16-byte digest of the chain content.
+
+        Computed on first access and reused afterwards, since the chain is
+        immutable after construction.
+
+        Returns
+        -------
+        str
+            Hex digest of all prompts in the chain
+        """
+        if self._hash is None:
+            self._hash = content_hexdigest(str(self).encode())
+        return self._hash
+
+    def token_counts(self, model: str) -> List[int]:
+        """
+        Get per-prompt token counts for a model.
+
+        All prompts are batch-encoded in a single encoder call on first
+        access and the counts are reused afterwards.
+
+        Parameters
+        ----------
+        model : str
+            Name of the model whose encoder to use
+
+        Returns
+        -------
+        List[int]
+            Token count of each prompt in the chain
+        """
+        if model not in self._token_counts:
+            from ..tokens import TokenCounter
+            self._token_counts[model] = TokenCounter().count_batch(
+                model, self._step_strings()
+            )
+        return self._token_counts[model]
 
     def _format(self, index: int, context: str | None = None) -> str:
         """
@@ -107,8 +198,13 @@ class PromptChain(Prompt):
         -------
         str
             All prompts in the chain joined by newlines
+
+        The chain is immutable after construction, so the joined string is
+        built once and reused by callers that hash, count or log it.
         """
-        return "\n".join([str(prompt) for prompt in self._prompts])
+        if self._joined is None:
+            self._joined = "\n".join(self._step_strings())
+        return self._joined
 
     def __repr__(self) -> str:
         """
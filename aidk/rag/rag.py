@@ -1,3 +1,5 @@
+import uuid
+
 from litellm import embedding
 from aidk.keys.keys_manager import load_key
 from aidk.rag.vectordb import ChromaVectorDB
@@ -129,13 +131,35 @@ class RAG:
         
         if vector_db == "chroma":
             self._vector_db = ChromaVectorDB(
-                name=database, 
-                vectorizer_provider=provider, 
+                name=database,
+                vectorizer_provider=provider,
                 vectorizer_model=vectorizer
             )
         else:
             raise ValueError(f"Vector database '{vector_db}' not supported. Currently only 'chroma' is supported.")
-        
+
+        # Bumped on every ingestion; models key their retrieval caches on
+        # it so cached results are invalidated when the collection changes
+        self.version = 0
+
+    def add(self, documents: List[str], metadatas: Optional[List[Dict]] = None, ids: Optional[List[str]] = None) -> None:
+        """
+        Add documents to the vector database.
+
+        Parameters:
+        -----------
+        documents : List[str]
+            List of text documents to add to the database.
+        metadatas : List[Dict], optional
+            Metadata dictionary for each document.
+        ids : List[str], optional
+            Unique identifier for each document, generated when omitted.
+        """
+        if ids is None:
+            ids = [uuid.uuid4().hex for _ in documents]
+        self._vector_db.add(documents, metadatas, ids)
+        self.version += 1
+
 
     def query(self, query: str, k: int = 10) -> Dict[str, Any]:
         """
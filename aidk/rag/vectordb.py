@@ -1,3 +1,5 @@
+import uuid
+
 from litellm import embedding
 from typing import List, Dict, Any, Optional, Union
 
@@ -265,7 +267,8 @@ class ChromaVectorDB(_BaseVectorDB):
             except chromadb.errors.NotFoundError:
                 self._collection = self._client.create_collection(name)
 
-    def add(self, documents: List[str], metadatas: List[Dict], ids: List[str]) -> None:
+    def add(self, documents: List[str], metadatas: Optional[List[Dict]] = None,
+            ids: Optional[List[str]] = None) -> None:
         """
         Add documents to the ChromaDB collection.
         
@@ -279,14 +282,16 @@ class ChromaVectorDB(_BaseVectorDB):
             List of text documents to add to the database.
             Each document will be converted to a vector embedding.
             
-        metadatas : List[Dict]
+        metadatas : List[Dict], optional
             List of metadata dictionaries for each document.
             Each metadata dict can contain any key-value pairs for
             document categorization and filtering.
-            
-        ids : List[str]
+            If None, no metadata is stored.
+
+        ids : List[str], optional
             List of unique identifiers for each document.
             IDs must be unique within the collection.
+            If None, IDs are auto-generated.
             
         Raises:
         -------
@@ -314,14 +319,18 @@ class ChromaVectorDB(_BaseVectorDB):
         
         Notes:
         ------
-        - All three lists must have the same length
+        - Lists that are provided must all have the same length
         - IDs must be unique within the collection
         - Documents are automatically embedded using the configured model
         - Metadata can be used for filtering during queries
         """
-        if not (len(documents) == len(metadatas) == len(ids)):
+        if metadatas is not None and len(metadatas) != len(documents):
             raise ValueError("documents, metadatas, and ids must have the same length")
-            
+        if ids is not None and len(ids) != len(documents):
+            raise ValueError("documents, metadatas, and ids must have the same length")
+        if ids is None:
+            ids = [uuid.uuid4().hex for _ in documents]
+
         self._collection.add(
             documents=documents,
             metadatas=metadatas,
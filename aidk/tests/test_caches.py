@@ -0,0 +1,118 @@
+import time
+
+from aidk import _json
+from aidk.conf import Conf
+from aidk.models import _response_cache
+from aidk.models._response_cache import _LruTtlCache, exact_cache_key, exact_cache_get, exact_cache_set
+from aidk.models._prefix_store import _PrefixStore
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = _LruTtlCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # refresh "a"
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_lru_cache_expires_entries_after_ttl():
+    cache = _LruTtlCache(maxsize=2, ttl=0.05)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    time.sleep(0.06)
+    assert cache.get("a") is None
+
+
+def test_exact_cache_key_normalizes_whitespace_and_unicode():
+    messages_a = [{"content": "What  is\n the capital of France?", "role": "user"}]
+    messages_b = [{"content": "What is the capital of France?", "role": "user"}]
+    assert exact_cache_key("m", messages_a) == exact_cache_key("m", messages_b)
+
+
+def test_exact_cache_key_discriminates_inputs():
+    messages = [{"content": "What is 2+2?", "role": "user"}]
+    key = exact_cache_key("m", messages)
+    assert key != exact_cache_key("other-model", messages)
+    assert key != exact_cache_key("m", messages, response_format=int)
+    assert key != exact_cache_key("m", messages, max_tokens=10)
+
+
+def test_exact_cache_disabled_by_default():
+    key = exact_cache_key("m", [{"content": "hi", "role": "user"}])
+    exact_cache_set(key, {"choices": [1]})
+    assert exact_cache_get(key) is None
+
+
+def test_exact_cache_roundtrip_when_enabled():
+    cache_conf = Conf()["cache"]
+    cache_conf["exact"] = True
+    try:
+        key = exact_cache_key("m", [{"content": "hi", "role": "user"}])
+        assert exact_cache_get(key) is None
+        response = {"choices": [{"message": {"content": "hello"}}]}
+        exact_cache_set(key, response)
+        cached = exact_cache_get(key)
+        assert cached == response
+        assert cached is not response  # stored and returned as copies
+    finally:
+        cache_conf["exact"] = False
+        _response_cache._exact_cache = None
+
+
+def test_prefix_store_is_stable_per_prefix():
+    store = _PrefixStore()
+    messages = [{"content": "first", "role": "user"}]
+    assert store.key_for(messages) == store.key_for(messages)
+
+
+def test_prefix_store_shares_key_across_growing_conversation():
+    store = _PrefixStore()
+    opening = [{"content": "first", "role": "user"}]
+    extended = opening + [
+        {"content": "answer", "role": "assistant"},
+        {"content": "second", "role": "user"}
+    ]
+    assert store.key_for(extended) == store.key_for(opening)
+    assert store.key_for(opening) != store.key_for([{"content": "other", "role": "user"}])
+
+
+def test_prefix_store_bounds_node_count():
+    store = _PrefixStore(max_nodes=8)
+    for i in range(50):
+        store.key_for([{"content": f"conversation {i}", "role": "user"}])
+    assert store._nodes <= 8
+    # keys stay deterministic even once the tree is full
+    messages = [{"content": "conversation 49", "role": "user"}]
+    assert store.key_for(messages) == store.key_for(messages)
+
+
+def test_prefix_store_evicts_least_recently_touched_root():
+    store = _PrefixStore(max_nodes=2)
+    old = [{"content": "old", "role": "user"}]
+    hot = [{"content": "hot", "role": "user"}]
+    store.key_for(old)
+    store.key_for(hot)
+    store.key_for(hot)  # refresh "hot"
+    store.key_for([{"content": "new", "role": "user"}])
+    roots = store._root.children
+    assert len(roots) == 2
+    assert store.key_for(hot) == store.key_for(hot)
+
+
+def test_prefix_store_caps_indexed_depth():
+    store = _PrefixStore(max_depth=4)
+    messages = [{"content": str(i), "role": "user"} for i in range(10)]
+    key = store.key_for(messages)
+    assert store._nodes <= 4
+    assert store.key_for(messages) == key
+
+
+def test_json_roundtrip_with_sorted_keys():
+    payload = {"b": 1, "a": [1, 2, {"c": None}]}
+    encoded = _json.dumps(payload, sort_keys=True)
+    assert isinstance(encoded, bytes)
+    assert _json.loads(encoded) == payload
+    assert encoded == _json.dumps({"a": [1, 2, {"c": None}], "b": 1}, sort_keys=True)
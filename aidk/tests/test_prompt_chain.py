@@ -0,0 +1,45 @@
+import pytest
+
+from aidk.prompts import PromptChain
+
+
+def test_chain_requires_prompts():
+    with pytest.raises(ValueError):
+        PromptChain()
+
+
+def test_chain_interns_identical_string_steps():
+    a = PromptChain(prompts=["What is 2+2?", "And 3+3?"])
+    b = PromptChain(prompts=["What is 2+2?", "And 3+3?"])
+    assert a._prompts[0] is b._prompts[0]
+
+
+def test_chain_joins_and_caches_str():
+    chain = PromptChain(prompts=["first", "second"])
+    joined = str(chain)
+    assert joined == "first\nsecond"
+    assert str(chain) is joined  # built once and reused
+
+
+def test_chain_hash_is_stable_and_content_sensitive():
+    a = PromptChain(prompts=["first", "second"])
+    b = PromptChain(prompts=["first", "second"])
+    c = PromptChain(prompts=["first", "other"])
+    assert a.hash == b.hash
+    assert a.hash != c.hash
+    assert len(a.hash) == 32  # 16-byte hex digest
+
+
+def test_chain_precompute_fills_caches():
+    chain = PromptChain(prompts=["first", "second"])
+    chain.precompute()
+    assert chain._joined == "first\nsecond"
+    assert chain._hash is not None
+    assert chain.hash == chain._hash
+
+
+def test_chain_iteration_and_independence_flag():
+    chain = PromptChain(prompts=["first", "second"], independent=True)
+    assert chain.independent
+    assert chain._size == 2
+    assert list(chain) == ["first", "second"]
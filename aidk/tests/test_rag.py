@@ -0,0 +1,40 @@
+from aidk.rag.rag import RAG
+
+
+class _FakeVectorDB:
+    def __init__(self):
+        self.calls = []
+
+    def add(self, documents, metadatas, ids):
+        self.calls.append((documents, metadatas, ids))
+
+
+def _make_rag():
+    rag = RAG.__new__(RAG)
+    rag._vector_db = _FakeVectorDB()
+    rag.version = 0
+    return rag
+
+
+def test_add_with_defaults_generates_ids_and_bumps_version():
+    rag = _make_rag()
+    rag.add(["doc one", "doc two"])
+    documents, metadatas, ids = rag._vector_db.calls[0]
+    assert documents == ["doc one", "doc two"]
+    assert metadatas is None
+    assert len(ids) == 2
+    assert len(set(ids)) == 2  # one unique id per document
+    assert rag.version == 1
+
+
+def test_add_passes_explicit_metadatas_and_ids_through():
+    rag = _make_rag()
+    rag.add(["doc"], metadatas=[{"topic": "ai"}], ids=["doc_001"])
+    assert rag._vector_db.calls[0] == (["doc"], [{"topic": "ai"}], ["doc_001"])
+
+
+def test_version_increments_on_every_ingestion():
+    rag = _make_rag()
+    rag.add(["a"])
+    rag.add(["b"])
+    assert rag.version == 2
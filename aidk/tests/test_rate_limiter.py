@@ -0,0 +1,39 @@
+import asyncio
+
+from aidk._agents import RateLimiter
+
+
+def test_unlimited_limiter_admits_immediately():
+    limiter = RateLimiter()
+
+    async def _run():
+        async with limiter.acquire(estimated_tokens=10):
+            return True
+
+    assert asyncio.run(asyncio.wait_for(_run(), timeout=2))
+    assert not limiter._window  # no budgets, nothing tracked
+
+
+def test_oversized_request_is_clamped_not_stuck():
+    limiter = RateLimiter(tpm=100)
+
+    async def _run():
+        async with limiter.acquire(estimated_tokens=500):
+            return True
+
+    assert asyncio.run(asyncio.wait_for(_run(), timeout=2))
+    # the charge is capped at the full budget, not the raw estimate
+    assert [tokens for _, tokens in limiter._window] == [100]
+
+
+def test_requests_within_budget_record_their_charge():
+    limiter = RateLimiter(rpm=10, tpm=100)
+
+    async def _run():
+        async with limiter.acquire(estimated_tokens=30):
+            pass
+        async with limiter.acquire(estimated_tokens=40):
+            pass
+
+    asyncio.run(asyncio.wait_for(_run(), timeout=2))
+    assert [tokens for _, tokens in limiter._window] == [30, 40]
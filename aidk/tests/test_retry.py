@@ -0,0 +1,82 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from aidk import _retry
+from aidk._retry import with_backoff
+
+
+class _Transient(Exception):
+    pass
+
+
+@pytest.fixture
+def no_wait(monkeypatch):
+    monkeypatch.setattr(_retry, "_retryable_exceptions", lambda: (_Transient,))
+    monkeypatch.setattr(_retry, "_wait_seconds", lambda attempt, exc: 0)
+
+
+def test_with_backoff_retries_until_success(no_wait):
+    calls = {"n": 0}
+
+    @with_backoff
+    def flaky():
+        calls["n"] += 1
+        if calls["n"] < 3:
+            raise _Transient()
+        return "ok"
+
+    assert flaky() == "ok"
+    assert calls["n"] == 3
+
+
+def test_with_backoff_retries_async(no_wait):
+    calls = {"n": 0}
+
+    @with_backoff
+    async def flaky():
+        calls["n"] += 1
+        if calls["n"] < 2:
+            raise _Transient()
+        return "ok"
+
+    assert asyncio.run(flaky()) == "ok"
+    assert calls["n"] == 2
+
+
+def test_with_backoff_gives_up_after_max_attempts(no_wait):
+    calls = {"n": 0}
+
+    @with_backoff
+    def always_failing():
+        calls["n"] += 1
+        raise _Transient()
+
+    with pytest.raises(_Transient):
+        always_failing()
+    assert calls["n"] == _retry._MAX_ATTEMPTS
+
+
+def test_with_backoff_ignores_non_retryable_errors(no_wait):
+    calls = {"n": 0}
+
+    @with_backoff
+    def broken():
+        calls["n"] += 1
+        raise ValueError("not transient")
+
+    with pytest.raises(ValueError):
+        broken()
+    assert calls["n"] == 1
+
+
+def test_wait_seconds_honors_retry_after_header():
+    exc = SimpleNamespace(response=SimpleNamespace(headers={"retry-after": "2"}))
+    assert _retry._wait_seconds(0, exc) == 2.0
+
+
+def test_wait_seconds_is_bounded():
+    exc = SimpleNamespace(response=None)
+    for attempt in range(10):
+        assert 0 <= _retry._wait_seconds(attempt, exc) <= _retry._MAX_WAIT
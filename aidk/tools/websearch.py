@@ -93,12 +93,20 @@ class WebSearch:
         self.engine = engine
         self.max_results = max_results
         self.exclude_domains = exclude_domains
+        self._search_engine = None
+
+    def _get_engine(self) -> _BaseSearch:
+        # One client per WebSearch instance so repeated tool calls reuse
+        # the underlying HTTP connection instead of reconnecting per query
+        if self._search_engine is None:
+            if self.engine == "tavily":
+                self._search_engine = _TavilySearch(self.max_results, self.exclude_domains)
+            else:
+                self._search_engine = _DuckDuckGoSearch(self.max_results, self.exclude_domains)
+        return self._search_engine
 
     def get_tool(self):
-        if self.engine == "tavily":
-            def tool(query: str):
-                return search_web_with_tavily(query, max_results=self.max_results, exclude_domains=self.exclude_domains)
-        else:
-            def tool(query: str):
-                return search_web_with_duckduckgo(query, max_results=self.max_results, exclude_domains=self.exclude_domains)
+        def tool(query: str):
+            response, text_response = self._get_engine().search(query)
+            return {"data": response, "text": text_response}
         return tool